@@ -5,11 +5,16 @@ Bypasses the UI and directly sets dates via JavaScript
 """
 
 import os
+import re
 import sys
 import stat
+import json
 import time
+import shutil
+import subprocess
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone as dt_timezone
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -19,45 +24,623 @@ from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from webdriver_manager.chrome import ChromeDriverManager
 import threading
+from contextlib import contextmanager
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+# On-disk cache of the resolved Chrome binary and ChromeDriver
+DRIVER_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "direct_js_scraper", "chromedriver.json")
+
+CHROME_BINARIES = [
+    'google-chrome',
+    'google-chrome-stable',
+    'chromium',
+    'chromium-browser',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
+]
+
+CHROMEDRIVER_PATHS = [
+    '/opt/homebrew/bin/chromedriver',
+    '/usr/local/bin/chromedriver',
+    '/usr/bin/chromedriver'
+]
+
+# Per-day event counts of previously validated runs, used as historical norms
+DAY_COUNTS_FILE = "calendar_day_counts.json"
+
+# Fields identifying an event across snapshots when its row id is unknown
+EVENT_KEY_FIELDS = ("DateTime", "Currency", "Event")
+
+# Fields describing which event a record belongs to rather than its values
+EVENT_IDENTITY_FIELDS = ("EventId",) + EVENT_KEY_FIELDS
+
+# Fields depending on the zone the page was rendered in; reported but never diffed
+EVENT_TIME_FIELDS = ("Time", "Timestamp", "TimeZone")
+
+# Volatility tooltip of the sentiment cell -> importance level
+IMPORTANCE_MAP = {
+    "Low Volatility Expected": "Low",
+    "Moderate Volatility Expected": "Medium", 
+    "High Volatility Expected": "High"
+}
+
+# Format of the data-event-datetime attribute, e.g. "2015/12/31 02:00:00"
+DATETIME_FORMAT = "%Y/%m/%d %H:%M:%S"
+
+# Timezone the calendar is requested in, and the id of that zone in the calendar's
+# timeZone filter ("(GMT) Coordinated Universal Time")
+CALENDAR_TIMEZONE = "UTC"
+CALENDAR_TIMEZONE_ID = 55
+
+CALENDAR_URL = "https://www.investing.com/economic-calendar/"
+CALENDAR_FILTER_URL = "https://www.investing.com/economic-calendar/Service/getCalendarFilteredData"
+
+UNIX_EPOCH = pd.Timestamp("1970-01-01", tz="UTC")
+
+def format_utc_offset(minutes):
+    """Format an offset in minutes as a fixed-offset zone name such as UTC-04:00"""
+    sign = "+" if minutes >= 0 else "-"
+    return f"UTC{sign}{abs(minutes) // 60:02d}:{abs(minutes) % 60:02d}"
+
+def _tzinfo(timezone):
+    """Return a tzinfo for an IANA zone name or a fixed offset such as UTC-04:00"""
+    match = re.fullmatch(r"UTC([+-])(\d{2}):(\d{2})", timezone)
+    if not match:
+        return timezone
+    minutes = int(match.group(2)) * 60 + int(match.group(3))
+    return dt_timezone(timedelta(minutes=minutes if match.group(1) == "+" else -minutes))
+
+def to_utc_epoch(datetimes, timezone=CALENDAR_TIMEZONE):
+    """Convert calendar DateTime strings in the given timezone to UTC epoch seconds"""
+    local = pd.to_datetime(pd.Series(datetimes, dtype="object"), format=DATETIME_FORMAT, errors="coerce")
+    
+    # Repeated wall-clock times at a DST change are read as standard time
+    utc = local.dt.tz_localize(_tzinfo(timezone), ambiguous=np.zeros(len(local), dtype=bool),
+                               nonexistent="shift_forward").dt.tz_convert("UTC")
+    return ((utc - UNIX_EPOCH) // pd.Timedelta(seconds=1)).astype("Int64")
+
+def event_keys(events):
+    """Return a unique identity for each event in a batch"""
+    keys = []
+    occurrences = {}
+    
+    for event in events:
+        # The site's row id is stable and unique, so prefer it when it was captured
+        if event.get("EventId"):
+            keys.append(f"id:{event['EventId']}")
+            continue
+        
+        # Otherwise number repeated (DateTime, Currency, Event) rows in page order,
+        # e.g. a budget balance released both in % and in absolute terms
+        key = "|".join(str(event.get(field, "")) for field in EVENT_KEY_FIELDS)
+        count = occurrences.get(key, 0)
+        occurrences[key] = count + 1
+        keys.append(key if count == 0 else f"{key}#{count}")
+    
+    return keys
+
+class ChangeFeed:
+    """Append-only JSON Lines log of inserts and updates to scraped events"""
+    
+    def __init__(self, filename):
+        self.filename = filename
+        self.state = {}
+        self.next_offset = 0
+        self.lock = threading.Lock()
+        
+        # Rebuild the latest known values by replaying the existing log
+        for record, position in read_change_feed(filename):
+            self._apply(record)
+            self.next_offset = record["offset"] + 1
+    
+    def _apply(self, record):
+        """Update the known state of an event from one of its records"""
+        fields = self.state.setdefault(record["key"], {})
+        for field, (old, new) in record["changes"].items():
+            fields[field] = new
+        for field in EVENT_TIME_FIELDS:
+            if field in record["event"]:
+                fields[field] = record["event"][field]
+    
+    def merge(self, events, observed_at=None):
+        """Merge a batch of events and append a record for each one that changed"""
+        observed_at = observed_at or datetime.now(dt_timezone.utc).isoformat(timespec="seconds")
+        records = []
+        
+        with self.lock:
+            next_offset = self.next_offset
+            for event, key in zip(events, event_keys(events)):
+                previous = self.state.get(key)
+                changes = {
+                    field: [previous.get(field) if previous else None, value]
+                    for field, value in event.items()
+                    if field not in EVENT_IDENTITY_FIELDS + EVENT_TIME_FIELDS
+                    and (previous is None or previous.get(field) != value)
+                }
+                if previous is not None and not changes:
+                    continue
+                
+                # A batch whose timezone could not be verified keeps the last known timestamp
+                time_source = event if event.get("Timestamp") is not None or not previous else previous
+                
+                records.append({
+                    "offset": next_offset,
+                    "op": "update" if previous else "insert",
+                    "key": key,
+                    "event": {
+                        **{field: event.get(field) for field in EVENT_IDENTITY_FIELDS},
+                        **{field: time_source.get(field) for field in EVENT_TIME_FIELDS}
+                    },
+                    "changes": changes,
+                    "observed_at": observed_at
+                })
+                next_offset += 1
+            
+            if records:
+                with open(self.filename, "a", encoding="utf-8") as f:
+                    for record in records:
+                        f.write(json.dumps(record) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+            
+            # Only advance the known state once the records are durable
+            for record in records:
+                self._apply(record)
+            self.next_offset = next_offset
+        
+        return records
+
+def read_change_feed(filename, position=0):
+    """Yield (record, next_position) pairs from a feed starting at a byte position"""
+    if not os.path.exists(filename):
+        return
+    
+    with open(filename, "rb") as f:
+        f.seek(position)
+        for line in f:
+            # A partially written trailing line is skipped until it is complete
+            if not line.endswith(b"\n"):
+                break
+            position += len(line)
+            yield json.loads(line), position
+
+def convert_checkpoint_to_arrow(csv_file, arrow_file=None, timezone=None):
+    """Convert a CSV written by save_progress into an uncompressed Arrow IPC (Feather) file"""
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.feather as feather
+    
+    arrow_file = arrow_file or os.path.splitext(csv_file)[0] + ".arrow"
+    
+    # Keep every column as text so values like "02:00" or "9.35%" round-trip unchanged
+    with open(csv_file, encoding="utf-8") as f:
+        columns = f.readline().strip().split(",")
+    column_types = {column: pa.string() for column in columns}
+    if "Timestamp" in column_types:
+        column_types["Timestamp"] = pa.int64()
+    table = pa_csv.read_csv(
+        csv_file,
+        convert_options=pa_csv.ConvertOptions(
+            column_types=column_types,
+            strings_can_be_null=False
+        )
+    )
+    
+    # Checkpoints written before timestamps were normalized need their source timezone
+    if "Timestamp" not in table.column_names and timezone:
+        epochs = to_utc_epoch(table["DateTime"].to_pandas(), timezone)
+        table = table.append_column("Timestamp", pa.array(epochs, type=pa.int64(), from_pandas=True))
+        table = table.append_column("TimeZone", pa.array([timezone] * table.num_rows, type=pa.string()))
+    
+    # Store UTC epochs as a timestamp column so consumers get datetime64 directly
+    if "Timestamp" in table.column_names:
+        index = table.column_names.index("Timestamp")
+        table = table.set_column(index, "Timestamp", table["Timestamp"].cast(pa.timestamp("s", tz="UTC")))
+    
+    # Uncompressed so the file can be memory-mapped without decoding
+    feather.write_feather(table, arrow_file, compression="uncompressed")
+    print(f"💾 Converted {table.num_rows} events from {csv_file} to {arrow_file}")
+    return arrow_file
+
+def _checkpoint_identities(table):
+    """Return the event identity of every row in one checkpoint"""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    
+    # The UTC Timestamp identifies the release time in old and new checkpoints alike,
+    # whatever zone DateTime was rendered in and whether EventId was captured
+    when = table["DateTime"]
+    if "Timestamp" in table.column_names:
+        epochs = pc.cast(pc.cast(table["Timestamp"], pa.int64()), pa.string())
+        when = pc.if_else(pc.is_null(epochs), when, epochs)
+    identities = pc.binary_join_element_wise(when, table["Currency"], table["Event"], "|")
+    
+    # Repeated (time, Currency, Event) rows are numbered in page order; they are rare,
+    # so only those rows are visited in Python
+    counts = pa.table({"identity": identities}).group_by("identity").aggregate([("identity", "count")])
+    repeated = counts.filter(pc.greater(counts["identity_count"], 1))["identity"]
+    if len(repeated):
+        occurrence = np.zeros(table.num_rows, dtype=np.int64)
+        seen = {}
+        for row in np.flatnonzero(pc.is_in(identities, value_set=repeated.combine_chunks()).to_numpy(zero_copy_only=False)):
+            key = identities[int(row)].as_py()
+            occurrence[row] = seen.get(key, 0)
+            seen[key] = occurrence[row] + 1
+        suffix = pc.if_else(occurrence > 0, pc.binary_join_element_wise("#", pc.cast(pa.array(occurrence), pa.string()), ""), "")
+        identities = pc.binary_join_element_wise(identities, suffix, "")
+    
+    return identities
+
+def load_checkpoints(arrow_files, as_pandas=False):
+    """Memory-map Arrow checkpoints and merge them by event identity, later files winning"""
+    import pyarrow as pa
+    
+    tables = []
+    identities = []
+    for arrow_file in arrow_files:
+        with pa.memory_map(arrow_file, "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+        tables.append(table)
+        ids = _checkpoint_identities(table)
+        identities.extend(ids.chunks if isinstance(ids, pa.ChunkedArray) else [ids])
+    
+    if not tables:
+        return None
+    
+    table = pa.concat_tables(tables, promote_options="default")
+    
+    # Keep the last occurrence of each event; only the key columns are materialised
+    keyed = pa.table({
+        "__identity": pa.chunked_array(identities, type=pa.string()),
+        "__row": pa.array(np.arange(table.num_rows, dtype=np.int64))
+    })
+    latest = keyed.group_by("__identity").aggregate([("__row", "max")])
+    
+    # Without duplicates the memory-mapped columns are returned as they are
+    if latest.num_rows < table.num_rows:
+        table = table.take(latest["__row_max"].combine_chunks().sort())
+    
+    return table.to_pandas() if as_pandas else table
+
+class BrowserTab:
+    """A tab in a shared browser that behaves like its own WebDriver"""
+    
+    def __init__(self, browser, handle):
+        self.browser = browser
+        self.handle = handle
+        self.uses = 0
+    
+    @contextmanager
+    def exclusive(self):
+        """Hold the browser and keep this tab focused for a sequence of commands"""
+        with self.browser["lock"]:
+            if self.browser["current"] != self.handle:
+                self.browser["driver"].switch_to.window(self.handle)
+                self.browser["current"] = self.handle
+            yield self
+    
+    def _navigate(self, navigate):
+        """Mark the current document stale, then start a navigation without waiting for it"""
+        with self.exclusive():
+            # With the "none" page load strategy the old document stays "complete" until the
+            # new one commits; wait_for_page_load waits for the marker to disappear
+            self.browser["driver"].execute_script("window.__staleDocument = true;")
+            navigate()
+    
+    def get(self, url):
+        self._navigate(lambda: self.browser["driver"].get(url))
+    
+    def refresh(self):
+        self._navigate(self.browser["driver"].refresh)
+    
+    def __getattr__(self, name):
+        # Properties such as title or page_source are fetched on access
+        with self.exclusive():
+            attr = getattr(self.browser["driver"], name)
+        
+        if not callable(attr):
+            return attr
+        
+        def call(*args, **kwargs):
+            with self.exclusive():
+                return attr(*args, **kwargs)
+        return call
+
+class SharedBrowserPool:
+    """Hands out tabs of a few shared Chrome processes instead of one Chrome per range"""
+    
+    def __init__(self, create_driver, tabs_per_browser=4, recycle_after=5):
+        self.create_driver = create_driver
+        self.tabs_per_browser = tabs_per_browser
+        self.recycle_after = recycle_after
+        self.browsers = []
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Return an idle tab, opening a tab or browser when all are busy"""
+        with self.lock:
+            for browser in self.browsers:
+                if browser["idle"]:
+                    return browser["idle"].pop()
+            
+            # Reserve a tab slot so concurrent callers respect the per-browser limit
+            browser = next((b for b in self.browsers if len(b["tabs"]) < self.tabs_per_browser), None)
+            starting = browser is None
+            if starting:
+                browser = {
+                    "driver": None,
+                    "ready": threading.Event(),
+                    "lock": threading.RLock(),
+                    "current": None,
+                    "tabs": [],
+                    "idle": []
+                }
+                self.browsers.append(browser)
+            tab = BrowserTab(browser, None)
+            browser["tabs"].append(tab)
+        
+        # Browser startup and tab creation happen outside the pool lock
+        try:
+            if starting:
+                # The first window must be claimed before other workers may open tabs
+                try:
+                    with browser["lock"]:
+                        browser["driver"] = self.create_driver()
+                        browser["current"] = tab.handle = browser["driver"].current_window_handle
+                finally:
+                    browser["ready"].set()
+                print(f"🌐 Started shared browser ({self.tabs_per_browser} tabs max)")
+            else:
+                browser["ready"].wait()
+                if browser["driver"] is None:
+                    raise Exception("Shared browser failed to start")
+                with browser["lock"]:
+                    browser["driver"].switch_to.new_window("tab")
+                    browser["current"] = tab.handle = browser["driver"].current_window_handle
+        except Exception:
+            self._drop_browser(browser)
+            raise
+        
+        return tab
+    
+    def release(self, tab, discard=False):
+        """Return a tab to the pool, closing it if it failed or has been used enough"""
+        browser = tab.browser
+        tab.uses += 1
+        
+        try:
+            with tab.exclusive():
+                with self.lock:
+                    close_tab = (discard or tab.uses >= self.recycle_after) and len(browser["tabs"]) > 1
+                    if close_tab:
+                        browser["tabs"].remove(tab)
+                
+                if close_tab:
+                    # Close the tab to release the memory its page accumulated
+                    browser["driver"].close()
+                    browser["current"] = None
+                    return
+                
+                browser["driver"].get("about:blank")
+                if tab.uses >= self.recycle_after:
+                    tab.uses = 0
+            
+            with self.lock:
+                browser["idle"].append(tab)
+        except Exception as e:
+            print(f"⚠️  Shared browser failed, restarting it: {e}")
+            self._drop_browser(browser)
+    
+    def _drop_browser(self, browser):
+        """Remove an unusable browser, and all of its tabs, from the pool"""
+        with self.lock:
+            if browser not in self.browsers:
+                return
+            self.browsers.remove(browser)
+        
+        if browser["driver"]:
+            try:
+                browser["driver"].quit()
+            except:
+                pass
+    
+    def close(self):
+        """Quit every shared browser"""
+        with self.lock:
+            for browser in self.browsers:
+                try:
+                    browser["driver"].quit()
+                except:
+                    pass
+            self.browsers = []
+
 class DirectJavaScriptScraper:
-    def __init__(self, headless=True, max_workers=2):
+    # Resolution results are shared by every worker in the process
+    _resolved = None
+    _resolve_lock = threading.Lock()
+    
+    def __init__(self, headless=True, max_workers=2, driver_cache_file=DRIVER_CACHE_FILE, change_feed_file=None,
+                 tabs_per_browser=None, tab_recycle_after=5, calendar_timezone=CALENDAR_TIMEZONE,
+                 calendar_timezone_id=CALENDAR_TIMEZONE_ID, day_counts_file=DAY_COUNTS_FILE):
         self.headless = headless
         self.max_workers = max_workers
+        self.calendar_timezone = calendar_timezone
+        self.calendar_timezone_id = calendar_timezone_id
+        self.tabs_per_browser = tabs_per_browser
+        self.tab_recycle_after = tab_recycle_after
+        self.browser_pool = None
+        self.driver_cache_file = driver_cache_file
+        self.change_feed = ChangeFeed(change_feed_file) if change_feed_file else None
         self.all_events = []
         self.scraped_ranges = []
+        self.day_counts_file = day_counts_file
         self.failed_ranges = []
+        self.failed_range_bounds = []
+        self.pinned_sessions = set()
+        self.range_stats = []
+        self.driver_timings = []
         self.lock = threading.Lock()
+    
+    @staticmethod
+    def _file_signature(path):
+        """Return (mtime, size) for a file, or None if it is missing"""
+        try:
+            file_stat = os.stat(path)
+            return [file_stat.st_mtime, file_stat.st_size]
+        except OSError:
+            return None
+    
+    def _load_driver_cache(self):
+        """Load the cached Chrome/ChromeDriver resolution if still valid"""
+        try:
+            with open(self.driver_cache_file) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
         
-    def check_chrome_installation(self):
-        """Check if Chrome is properly installed"""
+        # Both binaries must be unchanged since they were resolved
+        for key in ("chrome", "driver"):
+            path = cache.get(f"{key}_path")
+            if not path or self._file_signature(path) != cache.get(f"{key}_signature"):
+                return None
+        
+        if not os.access(cache["driver_path"], os.X_OK):
+            return None
+        
+        # Entries from before versions were recorded, or for a mismatched pair, are re-resolved
+        if not self._versions_match(cache.get("chrome_version"), cache.get("driver_version")):
+            return None
+        
+        return cache
+    
+    def _save_driver_cache(self, cache):
+        """Persist the Chrome/ChromeDriver resolution for later runs"""
         try:
-            import subprocess
-            result = subprocess.run(['google-chrome', '--version'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                print(f"✅ Chrome found: {result.stdout.strip()}")
-                return True
-        except:
-            pass
-            
+            os.makedirs(os.path.dirname(self.driver_cache_file), exist_ok=True)
+            tmp_file = f"{self.driver_cache_file}.{os.getpid()}.tmp"
+            with open(tmp_file, "w") as f:
+                json.dump(cache, f, indent=2)
+            os.replace(tmp_file, self.driver_cache_file)
+        except OSError as e:
+            print(f"⚠️  Could not save driver cache: {e}")
+    
+    @staticmethod
+    def _major_version(version_text):
+        """Return the major version from output like "Google Chrome 128.0.6613.84", or None"""
+        for token in (version_text or "").split():
+            major = token.split(".")[0]
+            if "." in token and major.isdigit():
+                return int(major)
+        return None
+    
+    def _versions_match(self, chrome_version, driver_version):
+        """Check that Chrome and ChromeDriver share a major version"""
+        chrome_major = self._major_version(chrome_version)
+        return chrome_major is not None and chrome_major == self._major_version(driver_version)
+    
+    def _read_version(self, path):
+        """Run a binary with --version and return its output, or None"""
         try:
-            result = subprocess.run(['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome', '--version'], 
+            result = subprocess.run([path, '--version'], 
                                   capture_output=True, text=True, timeout=10)
             if result.returncode == 0:
-                print(f"✅ Chrome found: {result.stdout.strip()}")
-                return True
-        except:
+                return result.stdout.strip()
+        except (OSError, subprocess.SubprocessError):
             pass
+        return None
+    
+    def _find_chrome(self):
+        """Locate the Chrome binary and read its version"""
+        for binary in CHROME_BINARIES:
+            path = shutil.which(binary) or (binary if os.path.exists(binary) else None)
+            if not path:
+                continue
+            version = self._read_version(path)
+            if version:
+                # Keep the path as found: snap launchers resolve to the snap dispatcher
+                return path, version
+        return None, None
+    
+    def _find_chromedriver(self, chrome_version):
+        """Locate a ChromeDriver matching Chrome's major version, downloading one only as a last resort"""
+        candidates = [shutil.which('chromedriver')] + CHROMEDRIVER_PATHS
+        for path in candidates:
+            if path and os.path.exists(path) and os.access(path, os.X_OK):
+                version = self._read_version(path)
+                if self._versions_match(chrome_version, version):
+                    return path, version, "System ChromeDriver"
+                print(f"⚠️  Skipping {path}: {version or 'unknown version'} does not match {chrome_version}")
+        
+        try:
+            path = os.path.realpath(ChromeDriverManager().install())
+            return path, self._read_version(path), "WebDriver Manager"
+        except Exception as e:
+            print(f"❌ WebDriver Manager failed: {e}")
+            return None, None, None
+    
+    def resolve_chrome(self, refresh=False, stale=None):
+        """Resolve Chrome and ChromeDriver once and share the result across workers"""
+        with DirectJavaScriptScraper._resolve_lock:
+            # A refresh is only needed if no other worker replaced the stale entry already
+            if DirectJavaScriptScraper._resolved and (not refresh or DirectJavaScriptScraper._resolved is not stale):
+                return DirectJavaScriptScraper._resolved
+            
+            cache = None if refresh else self._load_driver_cache()
+            if cache:
+                print(f"⚡ Using cached ChromeDriver: {cache['driver_path']}")
+            else:
+                start = time.time()
+                chrome_path, chrome_version = self._find_chrome()
+                if not chrome_path:
+                    return None
+                
+                driver_path, driver_version, source = self._find_chromedriver(chrome_version)
+                if not driver_path:
+                    return None
+                
+                cache = {
+                    "chrome_path": chrome_path,
+                    "chrome_version": chrome_version,
+                    "chrome_signature": self._file_signature(chrome_path),
+                    "driver_path": driver_path,
+                    "driver_version": driver_version,
+                    "driver_source": source,
+                    "driver_signature": self._file_signature(driver_path),
+                    "resolved_at": datetime.now().isoformat(timespec="seconds")
+                }
+                self._save_driver_cache(cache)
+                print(f"🔍 Resolved ChromeDriver via {source} in {time.time() - start:.2f}s: {driver_path}")
+            
+            DirectJavaScriptScraper._resolved = cache
+            return cache
+    
+    def check_chrome_installation(self):
+        """Check if Chrome is properly installed"""
+        resolved = self.resolve_chrome()
+        if resolved:
+            print(f"✅ Chrome found: {resolved['chrome_version']}")
+            return True
         
         print("❌ Chrome not found. Please install Google Chrome.")
         return False
-        
-    def create_driver(self):
-        """Create optimized Chrome driver"""
+    
+    def _record_driver_timing(self, attempt_name, elapsed, success):
+        """Record how long a driver creation attempt took"""
+        with self.lock:
+            self.driver_timings.append({
+                "attempt": attempt_name,
+                "seconds": round(elapsed, 3),
+                "success": success
+            })
+    
+    def _chrome_options(self, shared=False):
+        """Build the Chrome options for one launch attempt"""
         chrome_options = Options()
         
+        # A shared browser is locked per command, so no command may block on page loads
+        # or implicit waits; callers poll with WebDriverWait instead
+        if shared:
+            chrome_options.page_load_strategy = "none"
+        
         if self.headless:
             chrome_options.add_argument("--headless")
         
@@ -72,37 +655,74 @@ class DirectJavaScriptScraper:
         chrome_options.add_argument("--allow-running-insecure-content")
         chrome_options.add_argument("--remote-debugging-port=0")  # Use random port
         
-        # Try multiple approaches to create the driver
-        attempts = [
-            ("System ChromeDriver", lambda: webdriver.Chrome(options=chrome_options)),
-            ("Homebrew ChromeDriver", lambda: webdriver.Chrome(
-                service=Service("/opt/homebrew/bin/chromedriver"), 
-                options=chrome_options
-            )),
-            ("WebDriver Manager", lambda: webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()), 
-                options=chrome_options
-            ))
-        ]
+        # Keep background tabs running at full speed in shared-browser mode
+        if shared:
+            chrome_options.add_argument("--disable-background-timer-throttling")
+            chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+            chrome_options.add_argument("--disable-renderer-backgrounding")
+        
+        return chrome_options
+    
+    def create_driver(self, shared=False):
+        """Create optimized Chrome driver"""
+        implicit_wait = 0 if shared else 10
+        
+        # Fast path: reuse the resolved binaries, re-resolving once if they went stale.
+        # Every attempt gets fresh options so a bad binary_location cannot leak into the next
+        attempts = []
+        resolved = self.resolve_chrome()
+        if resolved:
+            attempts.append(("Cached ChromeDriver", lambda: self._launch_driver(self._chrome_options(shared), resolved)))
+            attempts.append(("Re-resolved ChromeDriver", lambda: self._launch_driver(
+                self._chrome_options(shared), self.resolve_chrome(refresh=True, stale=resolved)
+            )))
+        attempts.append(("Selenium Manager", lambda: webdriver.Chrome(options=self._chrome_options(shared))))
         
         for attempt_name, create_func in attempts:
+            start = time.time()
             try:
-                print(f"🔄 Trying {attempt_name}...")
                 driver = create_func()
-                driver.implicitly_wait(10)
-                print(f"✅ Successfully created driver using {attempt_name}")
+                driver.implicitly_wait(implicit_wait)
+                self._record_driver_timing(attempt_name, time.time() - start, True)
+                print(f"✅ Created driver using {attempt_name} in {time.time() - start:.2f}s")
                 return driver
             except Exception as e:
+                self._record_driver_timing(attempt_name, time.time() - start, False)
                 print(f"❌ {attempt_name} failed: {e}")
                 continue
         
         raise Exception("All ChromeDriver creation methods failed")
     
+    def _launch_driver(self, chrome_options, resolved):
+        """Start Chrome with an already resolved ChromeDriver binary"""
+        if not resolved:
+            raise Exception("ChromeDriver could not be resolved")
+        chrome_options.binary_location = resolved["chrome_path"]
+        return webdriver.Chrome(service=Service(resolved["driver_path"]), options=chrome_options)
+    
+    def acquire_driver(self):
+        """Get a driver for one range: a shared-browser tab or a dedicated Chrome"""
+        if self.browser_pool:
+            return self.browser_pool.acquire()
+        return self.create_driver()
+    
+    def release_driver(self, driver, failed=False):
+        """Give back a driver obtained from acquire_driver"""
+        if isinstance(driver, BrowserTab):
+            self.browser_pool.release(driver, discard=failed)
+            return
+        
+        try:
+            driver.quit()
+        except:
+            pass
+    
     def wait_for_page_load(self, driver, timeout=30):
         """Wait for page to fully load"""
         try:
+            # Shared-browser tabs mark the previous document stale, see BrowserTab._navigate
             WebDriverWait(driver, timeout).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
+                lambda d: d.execute_script("return window.__staleDocument ? 'stale' : document.readyState") == "complete"
             )
             time.sleep(3)  # Additional wait for JavaScript
             return True
@@ -220,7 +840,7 @@ class DirectJavaScriptScraper:
                 print("⚠️  No events found, trying alternative reload...")
                 
                 # Try reloading the page with URL parameters
-                base_url = "https://www.investing.com/economic-calendar/"
+                base_url = CALENDAR_URL
                 params_url = f"{base_url}?dateFrom={start_iso}&dateTo={end_iso}"
                 
                 print(f"   🔄 Trying URL with parameters: {params_url}")
@@ -241,13 +861,111 @@ class DirectJavaScriptScraper:
             print(f"❌ Failed to set date range: {e}")
             return False
     
-    def scroll_to_load_all_events(self, driver, max_scrolls=50):
+    def pin_calendar_timezone(self, driver, start_date, end_date):
+        """Select the calendar timezone through the site's own filter request and reload the page"""
+        # The zone is kept in the browser session, which every tab of a shared browser uses
+        session_id = driver.session_id
+        with self.lock:
+            if session_id in self.pinned_sessions:
+                return
+        
+        start_iso = datetime.strptime(start_date, "%m/%d/%Y").strftime("%Y-%m-%d")
+        end_iso = datetime.strptime(end_date, "%m/%d/%Y").strftime("%Y-%m-%d")
+        
+        # The filter request stores the timezone in the session, so the page and its
+        # scroll-loaded rows are rendered server-side in that zone afterwards
+        js_script = f"""
+        var done = arguments[arguments.length - 1];
+        var params = new URLSearchParams({{
+            dateFrom: '{start_iso}',
+            dateTo: '{end_iso}',
+            timeZone: '{self.calendar_timezone_id}',
+            timeFilter: 'timeRemain',
+            currentTab: 'custom',
+            submitFilters: '1',
+            limit_from: '0'
+        }});
+        
+        fetch('{CALENDAR_FILTER_URL}', {{
+            method: 'POST',
+            credentials: 'same-origin',
+            headers: {{
+                'Content-Type': 'application/x-www-form-urlencoded',
+                'X-Requested-With': 'XMLHttpRequest'
+            }},
+            body: params.toString()
+        }}).then(function(response) {{
+            done('HTTP ' + response.status);
+        }}).catch(function(e) {{
+            done('Error: ' + e.message);
+        }});
+        """
+        
+        try:
+            result = driver.execute_async_script(js_script)
+            print(f"   🕐 Timezone filter ({self.calendar_timezone}) result: {result}")
+            if str(result).startswith("HTTP 2"):
+                with self.lock:
+                    self.pinned_sessions.add(session_id)
+            
+            # Re-render the page already loaded so it picks up the session's new zone
+            driver.refresh()
+            self.wait_for_page_load(driver)
+        except Exception as e:
+            print(f"⚠️  Failed to pin calendar timezone: {e}")
+    
+    def detect_calendar_timezone(self, driver):
+        """Return the zone the calendar is rendered in, checked against the page's displayed GMT offset"""
+        js_script = """
+        // Only elements showing the session's current offset are trusted; the timezone
+        // picker lists every zone and must not be read
+        var selectors = ['#timeZoneGmtOffsetFormatted', '#economicCurrentTime'];
+        var pattern = /\\(GMT(?:\\s*([+-])\\s*(\\d{1,2})(?::(\\d{2}))?)?\\)/g;
+        var offsets = [];
+        
+        for (var selector of selectors) {
+            for (var el of document.querySelectorAll(selector)) {
+                for (var match of (el.innerText || el.textContent || '').matchAll(pattern)) {
+                    var minutes = match[2] ? parseInt(match[2], 10) * 60 + parseInt(match[3] || '0', 10) : 0;
+                    offsets.push(match[1] === '-' ? -minutes : minutes);
+                }
+            }
+        }
+        
+        var distinct = Array.from(new Set(offsets));
+        return distinct.length === 1 ? distinct[0] : null;
+        """
+        
+        try:
+            offset = driver.execute_script(js_script)
+        except Exception as e:
+            print(f"⚠️  Could not read calendar timezone: {e}")
+            offset = None
+        
+        if offset is None:
+            print("⚠️  Calendar GMT offset not found, timestamps will not be normalized")
+            return None
+        
+        expected = int(pd.Timestamp.now(tz=_tzinfo(self.calendar_timezone)).utcoffset().total_seconds() // 60)
+        if offset == expected:
+            print(f"✅ Calendar rendered in {self.calendar_timezone} ({format_utc_offset(offset)})")
+            return self.calendar_timezone
+        
+        # The session kept another zone; label the data with the offset actually rendered
+        print(f"⚠️  Calendar rendered in {format_utc_offset(offset)}, not {self.calendar_timezone}")
+        return format_utc_offset(offset)
+    
+    def scroll_to_load_all_events(self, driver, max_scrolls=50, stats=None):
         """Scroll down to load all events for the selected period"""
         print("📜 Loading all events by scrolling...")
         
         previous_event_count = 0
         stable_count = 0
         
+        # Assume truncation until the event count is seen to stabilise
+        if stats is not None:
+            stats["truncated"] = True
+        
         for scroll in range(max_scrolls):
             # Scroll to bottom
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
@@ -265,6 +983,8 @@ class DirectJavaScriptScraper:
                 stable_count += 1
                 if stable_count >= 3:  # Stop if count stable for 3 scrolls
                     print(f"✅ All events loaded: {current_count} total")
+                    if stats is not None:
+                        stats["truncated"] = False
                     break
             else:
                 stable_count = 0
@@ -284,6 +1004,10 @@ class DirectJavaScriptScraper:
             # Extract datetime from data attribute
             datetime_str = event_element.get_attribute("data-event-datetime")
             
+            # Extract the site's row id, e.g. id="eventRowId_512345"
+            row_id = event_element.get_attribute("id") or ""
+            event_id = row_id.replace("eventRowId_", "") if row_id.startswith("eventRowId_") else ""
+            
             # Extract time
             time_cell = event_element.find_element(By.CSS_SELECTOR, "td.time")
             time_text = time_cell.text.strip()
@@ -297,12 +1021,7 @@ class DirectJavaScriptScraper:
             importance_cell = event_element.find_element(By.CSS_SELECTOR, "td.sentiment")
             importance_title = importance_cell.get_attribute("title")
             
-            importance_map = {
-                "Low Volatility Expected": "Low",
-                "Moderate Volatility Expected": "Medium", 
-                "High Volatility Expected": "High"
-            }
-            importance = importance_map.get(importance_title, "Unknown")
+            importance = IMPORTANCE_MAP.get(importance_title, "Unknown")
             
             # Extract event name
             event_cell = event_element.find_element(By.CSS_SELECTOR, "td.event")
@@ -340,12 +1059,71 @@ class DirectJavaScriptScraper:
                 "Event": event_name,
                 "Actual": actual,
                 "Forecast": forecast,
-                "Previous": previous
+                "Previous": previous,
+                "EventId": event_id
             }
             
         except Exception as e:
             return None
     
+    def normalize_timestamps(self, events, timezone):
+        """Add UTC epoch seconds and the source timezone to a batch of events in one vectorized step"""
+        if not events:
+            return events
+        
+        # Without a verified source zone the DateTime strings cannot be placed in UTC
+        if not timezone:
+            for event in events:
+                event["Timestamp"] = None
+                event["TimeZone"] = ""
+            return events
+        
+        epochs = to_utc_epoch([event["DateTime"] for event in events], timezone)
+        for event, epoch in zip(events, epochs.tolist()):
+            event["Timestamp"] = None if epoch is pd.NA else epoch
+            event["TimeZone"] = timezone
+        
+        return events
+    
+    def extract_all_events(self, driver):
+        """Extract every loaded event row in the page with a single script call"""
+        js_script = f"""
+        var importanceMap = {json.dumps(IMPORTANCE_MAP)};
+        
+        function cellText(row, selector) {{
+            var cell = row.querySelector(selector);
+            return cell ? cell.innerText.trim() : '';
+        }}
+        
+        return Array.from(document.querySelectorAll('tr.js-event-item')).map(function(row) {{
+            // Rows missing a required cell are dropped, as in extract_event_data
+            var timeCell = row.querySelector('td.time');
+            var currencyCell = row.querySelector('td.flagCur');
+            var importanceCell = row.querySelector('td.sentiment');
+            var eventLink = row.querySelector('td.event a');
+            if (!timeCell || !currencyCell || !importanceCell || !eventLink) {{
+                return null;
+            }}
+            
+            var currency = currencyCell.innerText.trim();
+            var rowId = row.id || '';
+            
+            return {{
+                DateTime: row.getAttribute('data-event-datetime'),
+                Time: timeCell.innerText.trim(),
+                Currency: currency.length >= 3 ? currency.slice(-3) : currency,
+                Importance: importanceMap[importanceCell.getAttribute('title')] || 'Unknown',
+                Event: eventLink.innerText.trim(),
+                Actual: cellText(row, 'td.act'),
+                Forecast: cellText(row, 'td.fore'),
+                Previous: cellText(row, 'td.prev'),
+                EventId: rowId.indexOf('eventRowId_') === 0 ? rowId.slice('eventRowId_'.length) : ''
+            }};
+        }});
+        """
+        
+        return driver.execute_script(js_script) or []
+    
     def scrape_date_range(self, start_date, end_date, worker_id=0):
         """Scrape events for a specific date range"""
         driver = None
@@ -357,52 +1135,82 @@ class DirectJavaScriptScraper:
                 try:
                     print(f"🚀 Worker {worker_id}: Starting range {start_date} to {end_date} (attempt {attempt + 1})")
                     
+                    # Events of a failed attempt are discarded
+                    range_events = []
+                    
                     # Add delay between attempts
                     if attempt > 0:
                         delay = attempt * 2
                         print(f"⏳ Worker {worker_id}: Waiting {delay}s before retry...")
                         time.sleep(delay)
                     
-                    driver = self.create_driver()
+                    driver = self.acquire_driver()
                     
                     # Load investing.com economic calendar
                     print(f"🌐 Worker {worker_id}: Loading investing.com...")
-                    driver.get("https://www.investing.com/economic-calendar/")
+                    driver.get(CALENDAR_URL)
                     
                     # Wait for page to load
                     if not self.wait_for_page_load(driver):
                         raise Exception("Page failed to load")
                     
+                    # Pin the timezone the site renders event times in
+                    self.pin_calendar_timezone(driver, start_date, end_date)
+                    
                     # Set date range directly
                     if not self.set_date_range_direct(driver, start_date, end_date):
                         raise Exception("Failed to set date range")
                     
+                    # Record the zone of the page actually scraped
+                    calendar_timezone = self.detect_calendar_timezone(driver)
+                    
                     # Scroll to load all events
-                    event_elements = self.scroll_to_load_all_events(driver)
+                    scroll_stats = {}
+                    event_elements = self.scroll_to_load_all_events(driver, stats=scroll_stats)
                     
                     print(f"📊 Worker {worker_id}: Extracting {len(event_elements)} events...")
                     
                     # Extract data from all events
-                    for i, event_element in enumerate(event_elements):
-                        try:
-                            event_data = self.extract_event_data(event_element)
-                            if event_data:
-                                range_events.append(event_data)
+                    if isinstance(driver, BrowserTab):
+                        # One script call, so other tabs of the shared browser are held up only briefly
+                        range_events.extend(event for event in self.extract_all_events(driver) if event)
+                    else:
+                        for i, event_element in enumerate(event_elements):
+                            try:
+                                event_data = self.extract_event_data(event_element)
+                                if event_data:
+                                    range_events.append(event_data)
+                                    
+                                    if (i + 1) % 100 == 0:
+                                        print(f"   Worker {worker_id}: Processed {i + 1}/{len(event_elements)} events")
                                 
-                                if (i + 1) % 100 == 0:
-                                    print(f"   Worker {worker_id}: Processed {i + 1}/{len(event_elements)} events")
-                            
-                        except StaleElementReferenceException:
-                            continue
-                        except Exception as e:
-                            continue
+                            except StaleElementReferenceException:
+                                continue
+                            except Exception as e:
+                                continue
                     
                     print(f"✅ Worker {worker_id}: Successfully extracted {len(range_events)} events")
                     
+                    self.normalize_timestamps(range_events, calendar_timezone)
+                    
+                    # Emit inserts and revisions to the change feed before the range is recorded,
+                    # so a failed write retries the range without duplicating its events
+                    if self.change_feed:
+                        changes = self.change_feed.merge(range_events)
+                        print(f"📝 Worker {worker_id}: {len(changes)} changes written to {self.change_feed.filename}")
+                    
                     # Thread-safe addition to main list
                     with self.lock:
                         self.all_events.extend(range_events)
                         self.scraped_ranges.append(f"{start_date} to {end_date}")
+                        self.range_stats.append({
+                            "start": start_date,
+                            "end": end_date,
+                            "loaded": len(event_elements),
+                            "extracted": len(range_events),
+                            "dropped": len(event_elements) - len(range_events),
+                            "truncated": scroll_stats.get("truncated", False)
+                        })
                     
                     # Success - break the retry loop
                     break
@@ -412,25 +1220,20 @@ class DirectJavaScriptScraper:
                     print(f"❌ Worker {worker_id}: Attempt {attempt + 1} failed for range {start_date} to {end_date}: {error_msg}")
                     
                     if driver:
-                        try:
-                            driver.quit()
-                        except:
-                            pass
+                        self.release_driver(driver, failed=True)
                         driver = None
                     
                     # If this was the last attempt, record the failure
                     if attempt == max_retries - 1:
                         with self.lock:
                             self.failed_ranges.append(f"{start_date} to {end_date}: {error_msg}")
+                            self.failed_range_bounds.append((start_date, end_date))
                     else:
                         print(f"🔄 Worker {worker_id}: Will retry in {(attempt + 1) * 2} seconds...")
             
         finally:
             if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
+                self.release_driver(driver)
         
         return len(range_events)
     
@@ -455,6 +1258,123 @@ class DirectJavaScriptScraper:
         
         return ranges
     
+    def load_day_counts(self):
+        """Load per-day event counts saved by earlier validated runs"""
+        try:
+            with open(self.day_counts_file) as f:
+                day_counts = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if not day_counts:
+            return None
+        return pd.Series(day_counts, dtype="int64").rename(index=pd.Timestamp).sort_index()
+    
+    def save_day_counts(self, validation):
+        """Add the counts of days that passed validation to the saved historical norms"""
+        day_counts = self.load_day_counts()
+        
+        # Empty days from ranges that completed cleanly are kept too, so holidays become known
+        report = validation["day_counts"]
+        passed = report.loc[report["reason"].isin(["", "missing"]), "count"]
+        if day_counts is not None:
+            passed = passed.combine_first(day_counts)
+        
+        try:
+            with open(self.day_counts_file, "w") as f:
+                json.dump({day.strftime("%Y-%m-%d"): int(count) for day, count in passed.items()}, f)
+        except OSError as e:
+            print(f"⚠️  Could not save day counts: {e}")
+    
+    def validate_output(self, start_year, end_year, events=None, history=None, day_counts=None,
+                        min_ratio=0.25, min_expected=5):
+        """Check scraped events for missing or truncated days and list the days to rescrape"""
+        df = pd.DataFrame(self.all_events if events is None else events)
+        expected_ranges = self.generate_date_ranges(start_year, end_year)
+        
+        # Range boundaries must tile the requested years without gaps or overlaps
+        range_gaps = []
+        bounds = [(datetime.strptime(s, "%m/%d/%Y"), datetime.strptime(e, "%m/%d/%Y")) for s, e in expected_ranges]
+        expected_start = datetime(start_year, 1, 1)
+        for range_start, range_end in bounds:
+            if range_start != expected_start:
+                range_gaps.append((expected_start.strftime("%m/%d/%Y"), (range_start - timedelta(days=1)).strftime("%m/%d/%Y")))
+            expected_start = range_end + timedelta(days=1)
+        if expected_start <= datetime(end_year, 12, 31):
+            range_gaps.append((expected_start.strftime("%m/%d/%Y"), f"12/31/{end_year}"))
+        
+        # Per-day event counts in one vectorized pass
+        # Days after today cannot have been scraped yet
+        last_day = min(datetime(end_year, 12, 31), datetime.combine(datetime.now().date(), datetime.min.time()))
+        days = pd.date_range(datetime(start_year, 1, 1), last_day, freq="D")
+        if df.empty:
+            timestamps = pd.Series(dtype="datetime64[ns]")
+        else:
+            timestamps = pd.to_datetime(df["DateTime"], format=DATETIME_FORMAT, errors="coerce")
+        invalid_rows = int(timestamps.isna().sum())
+        counts = timestamps.dt.normalize().value_counts().reindex(days, fill_value=0)
+        
+        # Historical norm: median count for the same weekday in earlier output or saved day counts.
+        # The run itself is only a fallback, as broad truncation would lower its own norms
+        if history is not None:
+            history_times = pd.to_datetime(history["DateTime"], format=DATETIME_FORMAT, errors="coerce").dropna()
+            history_counts = history_times.dt.normalize().value_counts()
+            history_counts = history_counts.reindex(
+                pd.date_range(history_counts.index.min(), history_counts.index.max(), freq="D"), fill_value=0
+            )
+        elif day_counts is not None:
+            history_counts = day_counts
+        else:
+            print("⚠️  No historical day counts, using this run's own weekday medians as norms")
+            history_counts = counts
+        weekday_norms = history_counts.groupby(history_counts.index.dayofweek).median()
+        expected = pd.Series(days.dayofweek.map(weekday_norms).to_numpy(dtype=float), index=days).fillna(0)
+        
+        report = pd.DataFrame({"count": counts, "expected": expected})
+        report["reason"] = ""
+        report.loc[(report["expected"] >= min_expected) & (report["count"] < min_ratio * report["expected"]), "reason"] = "low_count"
+        report.loc[(report["expected"] >= min_expected) & (report["count"] == 0), "reason"] = "missing"
+        
+        # Days already known to be empty, and dates empty on every weekday they were seen
+        # in earlier years (fixed holidays such as Dec 25), are not flagged again
+        if history_counts is not counts:
+            known_empty = days.isin(history_counts.index[history_counts == 0])
+            weekdays = history_counts[history_counts.index.dayofweek < 5]
+            by_date = weekdays.groupby([weekdays.index.month, weekdays.index.day]).agg(["max", "count"])
+            holidays = by_date.index[(by_date["max"] == 0) & (by_date["count"] >= 2)]
+            recurring_empty = pd.MultiIndex.from_arrays([days.month, days.day]).isin(holidays)
+            report.loc[known_empty | recurring_empty, "reason"] = ""
+        
+        # Every day of a range that failed, was truncated or dropped rows must be rescraped
+        range_stats = pd.DataFrame(self.range_stats, columns=["start", "end", "loaded", "extracted", "dropped", "truncated"])
+        bad_ranges = [(row.start, row.end, "truncated" if row.truncated else "dropped_rows")
+                      for row in range_stats.itertuples() if row.truncated or row.dropped > 0]
+        bad_ranges += [(start, end, "failed_range") for start, end in self.failed_range_bounds]
+        bad_ranges += [(start, end, "range_gap") for start, end in range_gaps]
+        for range_start, range_end, reason in bad_ranges:
+            in_range = (days >= pd.Timestamp(datetime.strptime(range_start, "%m/%d/%Y"))) & \
+                       (days <= pd.Timestamp(datetime.strptime(range_end, "%m/%d/%Y")))
+            report.loc[in_range, "reason"] = reason
+        
+        flagged = report[report["reason"] != ""]
+        rescrape_days = flagged.index.strftime("%m/%d/%Y").tolist()
+        
+        print(f"🔎 Validation: {len(df)} events over {len(days)} days, {invalid_rows} invalid timestamps")
+        print(f"   Dropped rows: {int(range_stats['dropped'].sum())}, truncated ranges: {int(range_stats['truncated'].sum())}, range gaps: {len(range_gaps)}")
+        if rescrape_days:
+            print(f"⚠️  {len(rescrape_days)} days to rescrape: {flagged['reason'].value_counts().to_dict()}")
+        else:
+            print("✅ No missing or truncated days detected")
+        
+        return {
+            "day_counts": report,
+            "flagged_days": flagged,
+            "range_stats": range_stats,
+            "range_gaps": range_gaps,
+            "invalid_rows": invalid_rows,
+            "rescrape_days": rescrape_days
+        }
+    
     def save_progress(self, filename_prefix="direct_js_scraper"):
         """Save current progress to CSV"""
         if self.all_events:
@@ -462,6 +1382,8 @@ class DirectJavaScriptScraper:
             filename = f"{filename_prefix}_{len(self.all_events)}_events_{timestamp}.csv"
             
             df = pd.DataFrame(self.all_events)
+            if "Timestamp" in df.columns:
+                df["Timestamp"] = df["Timestamp"].astype("Int64")
             df.to_csv(filename, index=False)
             
             print(f"💾 Saved {len(self.all_events)} events to {filename}")
@@ -486,6 +1408,13 @@ class DirectJavaScriptScraper:
         date_ranges = self.generate_date_ranges(start_year, end_year)
         print(f"📅 Generated {len(date_ranges)} date ranges (3-month chunks)")
         
+        # Share a few browsers between workers when running in multi-tab mode
+        if self.tabs_per_browser:
+            self.browser_pool = SharedBrowserPool(
+                lambda: self.create_driver(shared=True), self.tabs_per_browser, self.tab_recycle_after
+            )
+            print(f"🗂️  Multi-tab mode: up to {self.tabs_per_browser} ranges per browser")
+        
         # Process ranges with threading
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             future_to_range = {
@@ -508,6 +1437,10 @@ class DirectJavaScriptScraper:
                 if completed % 5 == 0:
                     self.save_progress(f"checkpoint_direct_js")
         
+        if self.browser_pool:
+            self.browser_pool.close()
+            self.browser_pool = None
+        
         # Final results
         elapsed_time = time.time() - start_time
         
@@ -523,9 +1456,23 @@ class DirectJavaScriptScraper:
             events_per_second = len(self.all_events) / elapsed_time
             print(f"🚀 Performance: {events_per_second:.1f} events/second")
         
+        if self.driver_timings:
+            launched = [t["seconds"] for t in self.driver_timings if t["success"]]
+            failed = len(self.driver_timings) - len(launched)
+            if launched:
+                print(f"🌐 Driver startup: {sum(launched) / len(launched):.2f}s avg over {len(launched)} launches ({failed} failed attempts)")
+        
         # Save final results
         final_file = self.save_progress("complete_direct_js_scraper")
         
+        # Flag days that need to be scraped again
+        validation = self.validate_output(start_year, end_year, day_counts=self.load_day_counts())
+        self.save_day_counts(validation)
+        if validation["rescrape_days"]:
+            rescrape_file = f"rescrape_days_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            validation["flagged_days"].to_csv(rescrape_file, index_label="Date")
+            print(f"💾 Saved days to rescrape to {rescrape_file}")
+        
         return final_file
 
 def main():
@@ -536,7 +1483,8 @@ def main():
     # Create scraper
     scraper = DirectJavaScriptScraper(
         headless=True,
-        max_workers=4  # Optimal number for stability
+        max_workers=4,  # Optimal number for stability
+        change_feed_file="economic_calendar_changes.jsonl"
     )
     
     # Run scraper